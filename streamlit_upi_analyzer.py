@@ -7,23 +7,22 @@ Date: 02-01-2026
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-from datetime import datetime, timedelta
-import random
-try:
-    from ydata_profiling import ProfileReport
-    PROFILING_AVAILABLE = True
-except Exception as e:
-    PROFILING_AVAILABLE = False
-
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+import logging
+import os
+import shutil
+import tempfile
+import uuid
 import streamlit.components.v1 as components
 import base64
-from io import BytesIO
+from io import BytesIO, StringIO
 import warnings
 warnings.filterwarnings('ignore')
 
+logger = logging.getLogger(__name__)
+
 # Page Configuration
 st.set_page_config(
     page_title="UPI Log Analyzer Dashboard",
@@ -73,199 +72,485 @@ st.markdown("""
 # HELPER FUNCTIONS FOR DATA GENERATION
 # ============================================================================
 
-def generate_timestamps(n, base_date, hours_range=24):
-    """Generate random timestamps"""
-    timestamps = []
-    for i in range(n):
-        random_seconds = random.randint(0, hours_range * 3600)
-        timestamp = base_date + timedelta(seconds=random_seconds)
-        timestamps.append(timestamp.strftime('%Y-%m-%d %H:%M:%S'))
-    return timestamps
+def generate_timestamps(n, base_date, rng, hours_range=24):
+    """Generate random timestamps in ascending order"""
+    # Rows are drawn independently, so emitting each time column already sorted
+    # is equivalent to sorting the frame afterwards.
+    offsets = np.sort(rng.integers(0, hours_range * 3600, n, endpoint=True))
+    return pd.Timestamp(base_date) + pd.to_timedelta(offsets, unit='s')
 
-def generate_ip():
-    """Generate random IP address"""
-    return f"{random.randint(1, 255)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 255)}"
+DAY_DTYPE = pd.CategoricalDtype(['Monday', 'Tuesday', 'Wednesday', 'Thursday',
+                                 'Friday', 'Saturday', 'Sunday'], ordered=True)
 
-@st.cache_data
-def generate_synthetic_data():
+def add_time_columns(login_df, request_df):
+    """Precompute hour/day columns used by the time-based charts"""
+    login_df['hour'] = login_df['timestamp'].dt.hour.astype('int8')
+    request_df['hour'] = request_df['timestamp'].dt.hour.astype('int8')
+    request_df['day'] = request_df['timestamp'].dt.day_name().astype(DAY_DTYPE)
+
+def choose_by_mask(rng, mask, normal, suspicious, p_normal=None, p_suspicious=None):
+    """Draw from `normal` where mask is set and `suspicious` elsewhere, one vector call per pool"""
+    normal, suspicious = np.asarray(normal), np.asarray(suspicious)
+    out = np.empty(len(mask), dtype=np.result_type(normal, suspicious))
+    out[mask] = rng.choice(normal, mask.sum(), p=p_normal)
+    out[~mask] = rng.choice(suspicious, (~mask).sum(), p=p_suspicious)
+    return out
+
+def generate_ips(n, rng):
+    """Generate n random IP addresses from a single octet draw"""
+    octets = rng.integers([1, 0, 0, 1], 256, size=(n, 4), dtype=np.uint8)
+    return ['.'.join(map(str, row)) for row in octets.tolist()]
+
+def build_login_logs(rng, pools, n, base_date):
+    """FILE 1: User Login Logs"""
+    browsers = ['Chrome', 'Firefox', 'Safari', 'Edge', 'Opera', 'Mobile_App']
+    
+    is_normal = rng.random(n) < 0.85
+    login_data = {
+        'timestamp': generate_timestamps(n, base_date, rng),
+        'user_id': choose_by_mask(rng, is_normal, pools['user_ids'], pools['suspicious_users']),
+        'ip_address': choose_by_mask(rng, is_normal, pools['normal_ips'], pools['suspicious_ips']),
+        'login_status': choose_by_mask(rng, is_normal, ['success', 'failed'], ['success', 'failed'],
+                                       p_normal=[0.95, 0.05], p_suspicious=[0.3, 0.7]),
+        'browser': rng.choice(browsers, n)
+    }
+    
+    return pd.DataFrame(login_data).astype({'user_id': pools['user_dtype'], 'ip_address': pools['ip_dtype'],
+                                            'login_status': 'category', 'browser': 'category'})
+
+def build_session_logs(rng, pools, n, base_date):
+    """FILE 2: Session Duration Logs"""
+    is_normal = rng.random(n) < 0.80
+    is_short = rng.random(n) < 0.5
+    duration_min = np.where(is_normal, rng.integers(5, 61, n),
+                            np.where(is_short, rng.integers(1, 4, n), rng.integers(180, 481, n)))
+    
+    start = generate_timestamps(n, base_date, rng)
+    end = start + pd.to_timedelta(duration_min, unit='m')
+    
+    session_data = {
+        'session_id': [f"SES{str(i).zfill(5)}" for i in rng.permutation(n) + 1],
+        'user_id': choose_by_mask(rng, is_normal, pools['user_ids'], pools['suspicious_users']),
+        'start_time': start,
+        'end_time': end,
+        'duration_minutes': duration_min
+    }
+    
+    return pd.DataFrame(session_data).astype({'session_id': 'string[pyarrow]',
+                                              'user_id': pools['user_dtype'],
+                                              'duration_minutes': np.int16})
+
+def build_unauth_logs(rng, pools, n, base_date):
+    """FILE 3: Unauthenticated Access"""
+    failure_reasons = ['Invalid_Credentials', 'Expired_Token', 'Missing_Auth_Header', 
+                       'Brute_Force_Detected', 'Account_Locked', 'Invalid_OTP']
+    
+    is_normal = rng.random(n) < 0.70
+    unauth_data = {
+        'timestamp': generate_timestamps(n, base_date, rng),
+        'ip_address': choose_by_mask(rng, is_normal, pools['normal_ips'], pools['suspicious_ips']),
+        'auth_status': np.where(is_normal, 'authenticated', 'unauthenticated'),
+        'attempt_count': np.where(is_normal, 1, rng.integers(1, 16, n)),
+        'failure_reason': choose_by_mask(rng, is_normal, ['None'], failure_reasons)
+    }
+    
+    return pd.DataFrame(unauth_data).astype({'ip_address': pools['ip_dtype'], 'auth_status': 'category',
+                                             'attempt_count': np.int8, 'failure_reason': 'category'})
+
+def build_request_logs(rng, pools, n, base_date):
+    """FILE 4: Request Logs"""
+    # Per-category lookup tables, indexed by 0 = normal (75%), 1 = blank (15%), 2 = dos_attack (10%)
+    request_types = np.array(['normal', 'blank', 'dos_attack'])
+    payload_low = np.array([100, 0, 10000])
+    payload_high = np.array([5001, 51, 50001])
+    status_codes = np.array([[200, 400], [400, 403], [429, 503]])
+    first_code_p = np.array([0.95, 0.6, 0.7])
+    
+    category = np.digitize(rng.random(n), [0.75, 0.90])
+    
+    request_data = {
+        'timestamp': generate_timestamps(n, base_date, rng),
+        'ip_address': choose_by_mask(rng, category == 0, pools['normal_ips'], pools['suspicious_ips']),
+        'request_type': request_types[category],
+        'payload_size': rng.integers(payload_low[category], payload_high[category]),
+        'status_code': status_codes[category, (rng.random(n) >= first_code_p[category]).astype(int)]
+    }
+    
+    return pd.DataFrame(request_data).astype({'ip_address': pools['ip_dtype'], 'request_type': 'category',
+                                              'payload_size': np.int32, 'status_code': np.int16})
+
+def build_service_logs(rng, pools, n, base_date):
+    """FILE 5: Service Subscriptions"""
+    services = ['UPI_Transfer', 'Bill_Payment', 'Mobile_Recharge', 'DTH_Recharge', 
+                'Money_Request', 'QR_Payment', 'Merchant_Payment', 'International_Transfer']
+    plans = ['Basic', 'Premium', 'Gold', 'Enterprise']
+    
+    is_normal = rng.random(n) < 0.85
+    days_ago = np.sort(rng.integers(0, 181, n))[::-1]
+    sub_date = pd.Timestamp(base_date) - pd.to_timedelta(days_ago, unit='D')
+    
+    service_data = {
+        'user_id': choose_by_mask(rng, is_normal, pools['user_ids'], pools['suspicious_users']),
+        'service_name': rng.choice(services, n),
+        'subscription_date': sub_date,
+        'status': choose_by_mask(rng, is_normal, ['active', 'inactive'],
+                                 ['active', 'inactive', 'suspended', 'pending'],
+                                 p_normal=[0.9, 0.1], p_suspicious=[0.3, 0.2, 0.4, 0.1]),
+        'plan_type': rng.choice(plans, n)
+    }
+    
+    return pd.DataFrame(service_data).astype({'user_id': pools['user_dtype'], 'service_name': 'category',
+                                              'status': 'category', 'plan_type': 'category'})
+
+SYNTHETIC_BUILDERS = [build_login_logs, build_session_logs, build_unauth_logs,
+                      build_request_logs, build_service_logs]
+
+def build_synthetic_data():
     """Generate all 5 synthetic CSV files"""
     
-    np.random.seed(42)
-    random.seed(42)
+    # One independent stream for the shared pools and one per file, so the output
+    # does not depend on the order in which the worker threads run
+    pool_seed, *file_seeds = np.random.SeedSequence(42).spawn(len(SYNTHETIC_BUILDERS) + 1)
+    rng = np.random.default_rng(pool_seed)
     
     base_date = datetime(2026, 2, 1, 0, 0, 0)
+    n = 500
     
     # User pools
     user_ids = [f"USR{str(i).zfill(4)}" for i in range(1, 301)]
     suspicious_users = [f"SUS{str(i).zfill(4)}" for i in range(1, 51)]
     
     # IP pools
-    normal_ips = [generate_ip() for _ in range(200)]
-    suspicious_ips = [generate_ip() for _ in range(30)]
+    ip_pool = generate_ips(230, rng)
+    normal_ips, suspicious_ips = ip_pool[:200], ip_pool[200:]
     
-    # FILE 1: User Login Logs
-    login_data = {
-        'timestamp': generate_timestamps(500, base_date),
-        'user_id': [],
-        'ip_address': [],
-        'login_status': [],
-        'browser': []
+    # Low-cardinality columns become categoricals so value_counts runs on integer codes,
+    # and bounded numeric columns use the smallest integer type that fits
+    pools = {
+        'user_ids': user_ids,
+        'suspicious_users': suspicious_users,
+        'normal_ips': normal_ips,
+        'suspicious_ips': suspicious_ips,
+        'user_dtype': pd.CategoricalDtype(pd.unique(np.array(user_ids + suspicious_users))),
+        'ip_dtype': pd.CategoricalDtype(pd.unique(np.array(normal_ips + suspicious_ips)))
     }
     
-    browsers = ['Chrome', 'Firefox', 'Safari', 'Edge', 'Opera', 'Mobile_App']
+    # The builders spend most of their time in NumPy/pandas kernels, so threads overlap well
+    with ThreadPoolExecutor(max_workers=len(SYNTHETIC_BUILDERS)) as executor:
+        futures = [executor.submit(build, np.random.default_rng(seed), pools, n, base_date)
+                   for build, seed in zip(SYNTHETIC_BUILDERS, file_seeds)]
+        df1_login, df2_duration, df3_unauth, df4_requests, df5_services = [f.result() for f in futures]
     
-    for i in range(500):
-        if random.random() < 0.85:
-            login_data['user_id'].append(random.choice(user_ids))
-            login_data['ip_address'].append(random.choice(normal_ips))
-            login_data['login_status'].append(np.random.choice(['success', 'failed'], p=[0.95, 0.05]))
-        else:
-            login_data['user_id'].append(random.choice(suspicious_users))
-            login_data['ip_address'].append(random.choice(suspicious_ips))
-            login_data['login_status'].append(np.random.choice(['success', 'failed'], p=[0.3, 0.7]))
-        
-        login_data['browser'].append(random.choice(browsers))
+    add_time_columns(df1_login, df4_requests)
     
-    df1_login = pd.DataFrame(login_data).sort_values('timestamp').reset_index(drop=True)
+    return df1_login, df2_duration, df3_unauth, df4_requests, df5_services
+
+# Bump when the generated schema or distributions change so stale files are ignored
+SYNTHETIC_CACHE_VERSION = 7
+SYNTHETIC_CACHE_DIR = Path(tempfile.gettempdir()) / f"upi_synthetic_v{SYNTHETIC_CACHE_VERSION}"
+SYNTHETIC_CACHE_FILES = [SYNTHETIC_CACHE_DIR / f"df{i}.parquet" for i in range(1, 6)]
+
+@st.cache_data
+def generate_synthetic_data():
+    """Load synthetic data from the Parquet cache, generating it on a cold start"""
+    if all(f.exists() for f in SYNTHETIC_CACHE_FILES):
+        return tuple(pd.read_parquet(f) for f in SYNTHETIC_CACHE_FILES)
     
-    # FILE 2: Session Duration Logs
-    session_data = {
-        'session_id': [f"SES{str(i).zfill(5)}" for i in range(1, 501)],
-        'user_id': [],
-        'start_time': [],
-        'end_time': [],
-        'duration_minutes': []
-    }
+    dfs = build_synthetic_data()
     
-    for i in range(500):
-        start = base_date + timedelta(seconds=random.randint(0, 24*3600))
-        
-        if random.random() < 0.80:
-            duration_min = random.randint(5, 60)
-            session_data['user_id'].append(random.choice(user_ids))
-        else:
-            if random.random() < 0.5:
-                duration_min = random.randint(1, 3)
-            else:
-                duration_min = random.randint(180, 480)
-            session_data['user_id'].append(random.choice(suspicious_users))
-        
-        end = start + timedelta(minutes=duration_min)
-        
-        session_data['start_time'].append(start.strftime('%Y-%m-%d %H:%M:%S'))
-        session_data['end_time'].append(end.strftime('%Y-%m-%d %H:%M:%S'))
-        session_data['duration_minutes'].append(duration_min)
+    try:
+        SYNTHETIC_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        for df, f in zip(dfs, SYNTHETIC_CACHE_FILES):
+            # Unique temp name so concurrent writers never share a file before the rename
+            tmp = f.with_suffix(f'.{uuid.uuid4().hex}.tmp')
+            try:
+                df.to_parquet(tmp, compression='zstd')
+                tmp.replace(f)
+            finally:
+                tmp.unlink(missing_ok=True)
+    except OSError:
+        pass  # Read-only or full disk: keep serving from memory
     
-    df2_duration = pd.DataFrame(session_data).sort_values('start_time').reset_index(drop=True)
+    return dfs
+
+# Expected columns of each uploaded log: 'datetime' columns are parsed as dates,
+# None leaves the type to inference
+CSV_SCHEMAS = {
+    'login': {'timestamp': 'datetime', 'user_id': 'string[pyarrow]', 'ip_address': 'string[pyarrow]',
+              'login_status': 'category', 'browser': 'category'},
+    'session': {'session_id': 'string[pyarrow]', 'user_id': 'string[pyarrow]', 'start_time': 'datetime',
+                'end_time': 'datetime', 'duration_minutes': None},
+    'unauth': {'timestamp': 'datetime', 'ip_address': 'string[pyarrow]', 'auth_status': 'category',
+               'attempt_count': None, 'failure_reason': 'category'},
+    'request': {'timestamp': 'datetime', 'ip_address': 'string[pyarrow]', 'request_type': 'category',
+                'payload_size': None, 'status_code': None},
+    'service': {'user_id': 'string[pyarrow]', 'service_name': 'category', 'subscription_date': 'datetime',
+                'status': 'category', 'plan_type': 'category'}
+}
+
+# Uploads above this size are parsed in row chunks to bound the parser's peak memory.
+# Keep it well under Streamlit's server.maxUploadSize (200 MB by default) so it can trigger.
+LARGE_UPLOAD_BYTES = 50 * 1024 * 1024
+CSV_CHUNK_ROWS = 1_000_000
+
+def read_csv_chunked(buffer, read_options):
+    """Parse a large CSV chunk by chunk so only one chunk's raw parse is held at a time"""
+    dtype = read_options['dtype']
+    # Categories differ between chunks, so keep compact strings and categorise once at the end
+    categorical = [c for c, t in dtype.items() if t == 'category']
+    chunk_options = {**read_options, 'dtype': {**dtype, **dict.fromkeys(categorical, 'string[pyarrow]')}}
     
-    # FILE 3: Unauthenticated Access
-    unauth_data = {
-        'timestamp': generate_timestamps(500, base_date),
-        'ip_address': [],
-        'auth_status': [],
-        'attempt_count': [],
-        'failure_reason': []
+    chunks = pd.read_csv(buffer, engine='c', chunksize=CSV_CHUNK_ROWS, **chunk_options)
+    df = pd.concat(chunks, ignore_index=True)
+    return df.astype(dict.fromkeys(categorical, 'category'))
+
+def downcast_numeric(df, columns):
+    """Shrink inferred int64/float64 columns to the smallest dtype that holds their values"""
+    for column in columns:
+        if pd.api.types.is_integer_dtype(df[column]):
+            df[column] = pd.to_numeric(df[column], downcast='integer')
+        elif pd.api.types.is_float_dtype(df[column]):
+            df[column] = pd.to_numeric(df[column], downcast='float')
+    return df
+
+@st.cache_data(show_spinner=False)
+def load_csv(file_bytes, kind, file_name):
+    """Parse an uploaded CSV against its schema, cached on the file contents"""
+    schema = CSV_SCHEMAS[kind]
+    read_options = {
+        'usecols': list(schema),
+        'dtype': {c: t for c, t in schema.items() if t not in (None, 'datetime')},
+        'parse_dates': [c for c, t in schema.items() if t == 'datetime']
     }
     
-    failure_reasons = ['Invalid_Credentials', 'Expired_Token', 'Missing_Auth_Header', 
-                       'Brute_Force_Detected', 'Account_Locked', 'Invalid_OTP']
+    # The multi-threaded Arrow parser is much faster, but is stricter about
+    # e.g. missing values in integer columns; fall back to the C parser then.
+    # It can't stream, so very large files go through the chunked C parser.
+    if len(file_bytes) > LARGE_UPLOAD_BYTES:
+        df = read_csv_chunked(BytesIO(file_bytes), read_options)
+        engine = 'chunked c'
+    else:
+        try:
+            df = pd.read_csv(BytesIO(file_bytes), engine='pyarrow', **read_options)
+            engine = 'pyarrow'
+        except Exception:
+            df = pd.read_csv(BytesIO(file_bytes), engine='c', **read_options)
+            engine = 'c'
     
-    for i in range(500):
-        if random.random() < 0.70:
-            unauth_data['ip_address'].append(random.choice(normal_ips))
-            unauth_data['auth_status'].append('authenticated')
-            unauth_data['attempt_count'].append(1)
-            unauth_data['failure_reason'].append('None')
-        else:
-            unauth_data['ip_address'].append(random.choice(suspicious_ips))
-            unauth_data['auth_status'].append('unauthenticated')
-            unauth_data['attempt_count'].append(random.randint(1, 15))
-            unauth_data['failure_reason'].append(random.choice(failure_reasons))
+    # Unparseable dates leave the column as strings rather than failing the read
+    for column in read_options['parse_dates']:
+        if not pd.api.types.is_datetime64_any_dtype(df[column]):
+            raise ValueError(f"{file_name}: column '{column}' contains values that are not valid timestamps")
     
-    df3_unauth = pd.DataFrame(unauth_data).sort_values('timestamp').reset_index(drop=True)
+    logger.info("Parsed %s upload (%d rows) with the %s engine", kind, len(df), engine)
+    return downcast_numeric(df, [c for c, t in schema.items() if t is None])
+
+# Loaded frames live on disk between reruns; session state only holds their paths.
+# Directories of abandoned sessions are pruned once they sit idle past the max age.
+SESSION_DATA_DIR = Path(tempfile.gettempdir()) / "upi_sessions"
+SESSION_DATA_MAX_AGE = 24 * 3600
+DATASET_NAMES = ['df1_login', 'df2_duration', 'df3_unauth', 'df4_requests', 'df5_services']
+
+def prune_session_data():
+    """Remove stored session data that has not been read for SESSION_DATA_MAX_AGE"""
+    if not SESSION_DATA_DIR.exists():
+        return
+    cutoff = datetime.now().timestamp() - SESSION_DATA_MAX_AGE
+    for run_dir in SESSION_DATA_DIR.iterdir():
+        try:
+            if run_dir.stat().st_mtime < cutoff:
+                shutil.rmtree(run_dir, ignore_errors=True)
+        except OSError:
+            pass  # Removed concurrently by another session
+
+def touch_session_data(paths):
+    """Mark a load as in use so pruning measures idle time rather than time since load"""
+    os.utime(Path(paths[0]).parent)
+
+def discard_session_data(paths):
+    """Delete a previous load's files; the shared synthetic cache is left alone"""
+    run_dir = Path(paths[0]).parent
+    if run_dir.parent == SESSION_DATA_DIR:
+        shutil.rmtree(run_dir, ignore_errors=True)
+
+def save_datasets(dfs):
+    """Write a freshly loaded set of frames to Parquet and return their paths"""
+    prune_session_data()
+    run_dir = SESSION_DATA_DIR / uuid.uuid4().hex
+    run_dir.mkdir(parents=True)
+    paths = []
+    for name, df in zip(DATASET_NAMES, dfs):
+        path = run_dir / f"{name}.parquet"
+        df.to_parquet(path)
+        paths.append(str(path))
+    return paths
+
+@st.cache_resource(max_entries=2 * len(DATASET_NAMES), show_spinner=False)
+def load_dataset(path):
+    """Read a stored frame back, shared across reruns without copying"""
+    return pd.read_parquet(path)
+
+@st.cache_data(show_spinner=False)
+def to_csv_bytes(df, kind):
+    """Serialize a frame for download, cached so reruns don't re-encode it"""
+    # Export only the log's own columns, not the derived hour/day helpers
+    return df[list(CSV_SCHEMAS[kind])].to_csv(index=False).encode('utf-8')
+
+def load_profile_report():
+    """Import ydata_profiling on first use; returns None when it is unavailable"""
+    try:
+        from ydata_profiling import ProfileReport
+    except Exception:
+        return None
+    return ProfileReport
+
+# Profile reports take minutes on large logs, so they are built off the script
+# thread; one shared worker keeps concurrent requests from competing for CPU
+@st.cache_resource
+def get_profile_executor():
+    """Single process-wide executor for profile reports, created once across reruns"""
+    return ThreadPoolExecutor(max_workers=1)
+
+@st.cache_data(show_spinner=False)
+def summarize_frame(df, top_n=20):
+    """Cheap describe() plus top value counts per categorical column"""
+    value_counts = {}
+    for column in df.select_dtypes('category').columns:
+        counts = df[column].value_counts()
+        value_counts[column] = counts[counts > 0].head(top_n)
+    return {'describe': df.describe(include='all').astype('string'), 'value_counts': value_counts}
+
+# Each report is several MB of HTML, so bound how many stay in the disk cache
+@st.cache_data(persist='disk', max_entries=20, show_spinner=False)
+def build_profile_html(df, title):
+    """Render a full ydata-profiling report to HTML, persisted so repeat requests are instant"""
+    ProfileReport = load_profile_report()
+    profile = ProfileReport(df, title=title, explorative=True)
+    return profile.to_html()
+
+# ============================================================================
+# AGGREGATION HELPERS
+# ============================================================================
+
+@st.cache_data(show_spinner=False)
+def compute_request_summaries(df):
+    """Request-log aggregates shared by the charts and the fraud score"""
+    attack_mask = df['request_type'].isin(['blank', 'dos_attack'])
+    attack_ip_counts = df.loc[attack_mask, 'ip_address'].value_counts()
+    dos_ip_counts = df.loc[df['request_type']=='dos_attack', 'ip_address'].value_counts()
+    # Attack counts by observed day of week x 24 hours; small however long the log is
+    attack_heatmap = pd.crosstab(df.loc[attack_mask, 'day'], df.loc[attack_mask, 'hour'])
     
-    # FILE 4: Request Logs
-    request_data = {
-        'timestamp': generate_timestamps(500, base_date),
-        'ip_address': [],
-        'request_type': [],
-        'payload_size': [],
-        'status_code': []
+    return {
+        'attack_mask': attack_mask,
+        'type_counts': df['request_type'].value_counts(),
+        'attack_ip_counts': attack_ip_counts[attack_ip_counts > 0],
+        'dos_ip_counts': dos_ip_counts[dos_ip_counts > 0],
+        'attack_heatmap': attack_heatmap.reindex(columns=range(24), fill_value=0),
+        'attack_rate': attack_mask.mean()
     }
+
+@st.cache_data(show_spinner=False)
+def compute_session_summaries(df):
+    """Short/long session masks and counts from one pass over the durations"""
+    durations = df['duration_minutes'].to_numpy(dtype=float, na_value=np.nan)
+    short = durations < 3
+    long = durations > 180
+    suspicious = short | long
     
-    for i in range(500):
-        rand = random.random()
-        if rand < 0.75:
-            request_data['ip_address'].append(random.choice(normal_ips))
-            request_data['request_type'].append('normal')
-            request_data['payload_size'].append(random.randint(100, 5000))
-            request_data['status_code'].append(np.random.choice([200, 400], p=[0.95, 0.05]))
-        elif rand < 0.90:
-            request_data['ip_address'].append(random.choice(suspicious_ips))
-            request_data['request_type'].append('blank')
-            request_data['payload_size'].append(random.randint(0, 50))
-            request_data['status_code'].append(np.random.choice([400, 403], p=[0.6, 0.4]))
-        else:
-            request_data['ip_address'].append(random.choice(suspicious_ips))
-            request_data['request_type'].append('dos_attack')
-            request_data['payload_size'].append(random.randint(10000, 50000))
-            request_data['status_code'].append(np.random.choice([429, 503], p=[0.7, 0.3]))
-    
-    df4_requests = pd.DataFrame(request_data).sort_values('timestamp').reset_index(drop=True)
-    
-    # FILE 5: Service Subscriptions
-    service_data = {
-        'user_id': [],
-        'service_name': [],
-        'subscription_date': [],
-        'status': [],
-        'plan_type': []
+    return {
+        'suspicious_mask': pd.Series(suspicious, index=df.index),
+        'short_count': int(short.sum()),
+        'long_count': int(long.sum()),
+        'suspicious_count': int(suspicious.sum())
     }
+
+def preview_rows(df, mask, n=10, last=False):
+    """First (or last) n rows where mask holds, without materialising the whole filtered frame"""
+    idx = np.flatnonzero(mask.to_numpy(dtype=bool, na_value=False))
+    return df.iloc[idx[-n:] if last else idx[:n]]
+
+@st.cache_data(show_spinner=False)
+def count_failed_logins_by_ip(df):
+    """Failed login attempts per IP address, most frequent first"""
+    failed_by_ip = df.loc[df['login_status']=='failed', 'ip_address'].value_counts()
+    return failed_by_ip[failed_by_ip > 0]
+
+@st.cache_data(show_spinner=False)
+def compute_dashboard_stats(login_df, session_df, unauth_df, request_df, service_df):
+    """Headline counts and rates, one value_counts pass per status column"""
+    login_counts = login_df['login_status'].value_counts().to_dict()
+    auth_counts = unauth_df['auth_status'].value_counts().to_dict()
+    service_counts = service_df['status'].value_counts().to_dict()
+    request_summaries = compute_request_summaries(request_df)
+    request_counts = request_summaries['type_counts'].to_dict()
+    session_summaries = compute_session_summaries(session_df)
     
-    services = ['UPI_Transfer', 'Bill_Payment', 'Mobile_Recharge', 'DTH_Recharge', 
-                'Money_Request', 'QR_Payment', 'Merchant_Payment', 'International_Transfer']
-    plans = ['Basic', 'Premium', 'Gold', 'Enterprise']
-    
-    for i in range(500):
-        if random.random() < 0.85:
-            service_data['user_id'].append(random.choice(user_ids))
-            service_data['status'].append(np.random.choice(['active', 'inactive'], p=[0.9, 0.1]))
-        else:
-            service_data['user_id'].append(random.choice(suspicious_users))
-            service_data['status'].append(np.random.choice(['active', 'inactive', 'suspended', 'pending'], 
-                                                          p=[0.3, 0.2, 0.4, 0.1]))
-        
-        service_data['service_name'].append(random.choice(services))
-        sub_date = base_date - timedelta(days=random.randint(0, 180))
-        service_data['subscription_date'].append(sub_date.strftime('%Y-%m-%d'))
-        service_data['plan_type'].append(random.choice(plans))
-    
-    df5_services = pd.DataFrame(service_data).sort_values('subscription_date').reset_index(drop=True)
+    failed_count = int(login_counts.get('failed', 0))
+    unauth_count = int(auth_counts.get('unauthenticated', 0))
+    blank_count = int(request_counts.get('blank', 0))
+    dos_count = int(request_counts.get('dos_attack', 0))
     
-    return df1_login, df2_duration, df3_unauth, df4_requests, df5_services
+    return {
+        'login_counts': login_counts,
+        'auth_counts': auth_counts,
+        'request_counts': request_counts,
+        'service_counts': service_counts,
+        'total_logins': len(login_df),
+        'total_sessions': len(session_df),
+        'total_auth_attempts': len(unauth_df),
+        'total_requests': len(request_df),
+        'total_subscriptions': len(service_df),
+        'failed_count': failed_count,
+        'failed_rate': failed_count / len(login_df) * 100,
+        'unique_users': login_df['user_id'].nunique(),
+        'avg_duration': session_df['duration_minutes'].mean(),
+        'short_sessions': session_summaries['short_count'],
+        'long_sessions': session_summaries['long_count'],
+        'suspicious_sessions': session_summaries['suspicious_count'],
+        'unauth_count': unauth_count,
+        'unauth_rate': unauth_count / len(unauth_df) * 100,
+        'blank_count': blank_count,
+        'dos_count': dos_count,
+        'attack_count': blank_count + dos_count,
+        'attack_rate': request_summaries['attack_rate'] * 100
+    }
 
 # ============================================================================
 # VISUALIZATION FUNCTIONS
 # ============================================================================
 
+# Shared colour maps and category orders so charts keep statuses consistent
+LOGIN_COLORS = {'success': '#4caf50', 'failed': '#f44336'}
+AUTH_COLORS = {'authenticated': '#4caf50', 'unauthenticated': '#f44336'}
+REQUEST_COLORS = {'normal': '#4caf50', 'blank': '#ff9800', 'dos_attack': '#f44336'}
+CATEGORY_ORDERS = {
+    'login_status': ['success', 'failed'],
+    'request_type': ['normal', 'blank', 'dos_attack']
+}
+
+@st.cache_data(show_spinner=False)
 def create_login_trend_chart(df):
     """Login success/failure trend over time"""
-    df_copy = df.copy()
-    df_copy['timestamp'] = pd.to_datetime(df_copy['timestamp'])
-    df_copy['hour'] = df_copy['timestamp'].dt.hour
+    import plotly.express as px
     
-    trend = df_copy.groupby(['hour', 'login_status']).size().reset_index(name='count')
+    trend = df.value_counts(['hour', 'login_status']).sort_index().reset_index(name='count')
+    trend = trend[trend['count'] > 0]
     
     fig = px.line(trend, x='hour', y='count', color='login_status',
                   title='Login Attempts by Hour',
                   labels={'hour': 'Hour of Day', 'count': 'Number of Attempts'},
-                  color_discrete_map={'success': '#4caf50', 'failed': '#f44336'})
+                  color_discrete_map=LOGIN_COLORS,
+                  category_orders=CATEGORY_ORDERS)
     
     fig.update_layout(hovermode='x unified', height=400)
     return fig
 
+@st.cache_data(show_spinner=False)
 def create_session_distribution(df):
     """Session duration distribution"""
+    import plotly.express as px
+    
     fig = px.histogram(df, x='duration_minutes', 
                       title='Session Duration Distribution',
                       labels={'duration_minutes': 'Duration (minutes)', 'count': 'Frequency'},
@@ -281,37 +566,45 @@ def create_session_distribution(df):
     fig.update_layout(height=400)
     return fig
 
+@st.cache_data(show_spinner=False)
 def create_auth_pie_chart(df):
     """Authentication status breakdown"""
+    import plotly.express as px
+    
     auth_counts = df['auth_status'].value_counts()
     
     fig = px.pie(values=auth_counts.values, names=auth_counts.index,
                 title='Authentication Status Distribution',
-                color_discrete_map={'authenticated': '#4caf50', 'unauthenticated': '#f44336'})
+                color=auth_counts.index,
+                color_discrete_map=AUTH_COLORS)
     
     fig.update_traces(textposition='inside', textinfo='percent+label')
     fig.update_layout(height=400)
     return fig
 
-def create_request_type_chart(df):
+@st.cache_data(show_spinner=False)
+def create_request_type_chart(request_counts):
     """Request type breakdown"""
-    request_counts = df['request_type'].value_counts()
+    import plotly.express as px
     
-    colors = {'normal': '#4caf50', 'blank': '#ff9800', 'dos_attack': '#f44336'}
+    request_order = CATEGORY_ORDERS['request_type']
     
     fig = px.bar(x=request_counts.index, y=request_counts.values,
                 title='Request Type Distribution',
                 labels={'x': 'Request Type', 'y': 'Count'},
                 color=request_counts.index,
-                color_discrete_map=colors)
+                color_discrete_map=REQUEST_COLORS,
+                category_orders={'x': request_order, 'color': request_order})
     
     fig.update_layout(showlegend=False, height=400)
     return fig
 
-def create_top_ips_chart(df, top_n=10):
+@st.cache_data(show_spinner=False)
+def create_top_ips_chart(attack_ip_counts, top_n=10):
     """Top attacking IPs"""
-    suspicious_df = df[df['request_type'].isin(['blank', 'dos_attack'])]
-    top_ips = suspicious_df['ip_address'].value_counts().head(top_n)
+    import plotly.express as px
+    
+    top_ips = attack_ip_counts.head(top_n)
     
     fig = px.bar(x=top_ips.values, y=top_ips.index, orientation='h',
                 title=f'Top {top_n} Attacking IP Addresses',
@@ -322,18 +615,10 @@ def create_top_ips_chart(df, top_n=10):
     fig.update_layout(height=400, showlegend=False)
     return fig
 
-def create_attack_heatmap(df):
+@st.cache_data(show_spinner=False)
+def create_attack_heatmap(heatmap_pivot):
     """Attack pattern heatmap by hour"""
-    df_copy = df.copy()
-    df_copy['timestamp'] = pd.to_datetime(df_copy['timestamp'])
-    df_copy['hour'] = df_copy['timestamp'].dt.hour
-    df_copy['day'] = df_copy['timestamp'].dt.day_name()
-    
-    # Filter only attacks
-    attacks = df_copy[df_copy['request_type'].isin(['blank', 'dos_attack'])]
-    
-    heatmap_data = attacks.groupby(['day', 'hour']).size().reset_index(name='count')
-    heatmap_pivot = heatmap_data.pivot(index='day', columns='hour', values='count').fillna(0)
+    import plotly.express as px
     
     fig = px.imshow(heatmap_pivot,
                    labels=dict(x="Hour of Day", y="Day of Week", color="Attack Count"),
@@ -344,8 +629,11 @@ def create_attack_heatmap(df):
     fig.update_layout(height=400)
     return fig
 
+@st.cache_data(show_spinner=False)
 def create_service_chart(df):
     """Service subscription breakdown"""
+    import plotly.express as px
+    
     service_counts = df['service_name'].value_counts()
     
     fig = px.bar(x=service_counts.index, y=service_counts.values,
@@ -357,16 +645,48 @@ def create_service_chart(df):
     fig.update_layout(xaxis_tickangle=-45, height=400, showlegend=False)
     return fig
 
-def create_fraud_score_gauge(login_df, unauth_df, request_df):
-    """Calculate and display fraud risk score"""
+@st.cache_data(show_spinner=False)
+def create_browser_chart(df):
+    """Browser distribution of login attempts"""
+    import plotly.express as px
+    
+    browser_counts = df['browser'].value_counts()
+    
+    fig = px.pie(values=browser_counts.values, names=browser_counts.index,
+                title='Browser Distribution')
+    return fig
+
+@st.cache_data(show_spinner=False)
+def create_failure_reason_chart(df):
+    """Reasons behind unauthenticated attempts"""
+    import plotly.express as px
+    
+    failure_df = df[df['auth_status']=='unauthenticated']
+    reason_counts = failure_df['failure_reason'].value_counts()
+    reason_counts = reason_counts[reason_counts > 0]
+    
+    fig = px.bar(x=reason_counts.index, y=reason_counts.values,
+                title='Authentication Failure Reasons',
+                labels={'x': 'Reason', 'y': 'Count'})
+    fig.update_layout(xaxis_tickangle=-45)
+    return fig
+
+@st.cache_data(show_spinner=False)
+def create_subscription_status_chart(status_counts):
+    """Subscription status breakdown"""
+    import plotly.express as px
     
-    # Calculate metrics
-    failed_login_rate = len(login_df[login_df['login_status']=='failed']) / len(login_df) * 100
-    unauth_rate = len(unauth_df[unauth_df['auth_status']=='unauthenticated']) / len(unauth_df) * 100
-    attack_rate = len(request_df[request_df['request_type'].isin(['blank', 'dos_attack'])]) / len(request_df) * 100
+    fig = px.pie(values=list(status_counts.values()), names=list(status_counts.keys()),
+                title='Subscription Status Distribution')
+    return fig
+
+@st.cache_data(show_spinner=False)
+def create_fraud_score_gauge(stats):
+    """Calculate and display fraud risk score"""
+    import plotly.graph_objects as go
     
-    # Calculate composite fraud score (0-100)
-    fraud_score = (failed_login_rate * 0.3 + unauth_rate * 0.4 + attack_rate * 0.3)
+    # Calculate composite fraud score (0-100) from the precomputed rates
+    fraud_score = (stats['failed_rate'] * 0.3 + stats['unauth_rate'] * 0.4 + stats['attack_rate'] * 0.3)
     
     # Determine risk level
     if fraud_score < 15:
@@ -408,6 +728,430 @@ def create_fraud_score_gauge(login_df, unauth_df, request_df):
     fig.update_layout(height=400)
     return fig, fraud_score, risk_level
 
+# ============================================================================
+# DASHBOARD VIEWS
+# ============================================================================
+
+def render_overview(df1_login, df2_duration, df3_unauth, request_summaries, stats):
+    """Executive overview: fraud score, headline metrics and quick charts"""
+    st.header("📊 Executive Dashboard")
+    
+    # Fraud Risk Score
+    col1, col2, col3 = st.columns([2, 1, 1])
+    
+    with col1:
+        fraud_fig, _, _ = create_fraud_score_gauge(stats)
+        st.plotly_chart(fraud_fig, use_container_width=True)
+    
+    with col2:
+        st.metric("Total Login Attempts", stats['total_logins'])
+        st.metric("Failed Logins", stats['failed_count'])
+        st.metric("Unique Users", stats['unique_users'])
+    
+    with col3:
+        st.metric("DOS Attacks", stats['dos_count'])
+        st.metric("Blank Requests", stats['blank_count'])
+        st.metric("Unauth Attempts", stats['unauth_count'])
+    
+    st.markdown("---")
+    
+    # Key Metrics Cards
+    st.subheader("🎯 Key Security Metrics")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        failed_rate = stats['failed_rate']
+        st.markdown(f"""
+        <div class="{'alert-critical' if failed_rate > 10 else 'alert-success'}">
+            <h4>Login Failure Rate</h4>
+            <h2>{failed_rate:.1f}%</h2>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        avg_duration = stats['avg_duration']
+        st.markdown(f"""
+        <div class="alert-success">
+            <h4>Avg Session Duration</h4>
+            <h2>{avg_duration:.1f} min</h2>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        unauth_rate = stats['unauth_rate']
+        st.markdown(f"""
+        <div class="{'alert-critical' if unauth_rate > 30 else 'alert-warning'}">
+            <h4>Unauth Rate</h4>
+            <h2>{unauth_rate:.1f}%</h2>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col4:
+        attack_count = stats['attack_count']
+        st.markdown(f"""
+        <div class="{'alert-critical' if attack_count > 100 else 'alert-warning'}">
+            <h4>Total Attacks</h4>
+            <h2>{attack_count}</h2>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # Quick Visualizations
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.plotly_chart(create_login_trend_chart(df1_login), use_container_width=True)
+        st.plotly_chart(create_auth_pie_chart(df3_unauth), use_container_width=True)
+    
+    with col2:
+        st.plotly_chart(create_request_type_chart(request_summaries['type_counts']), use_container_width=True)
+        st.plotly_chart(create_session_distribution(df2_duration), use_container_width=True)
+
+@st.fragment
+def render_detailed_analysis(df1_login, df2_duration, df3_unauth, df4_requests, df5_services,
+                             request_summaries, stats):
+    """Per-log drill-down charts and tables"""
+    st.header("📈 Detailed Analysis & Visualizations")
+    
+    analysis_type = st.selectbox(
+        "Select Analysis Type:",
+        ["Login Analysis", "Session Analysis", "Authentication Analysis", 
+         "Attack Analysis", "Service Analysis"]
+    )
+    
+    if analysis_type == "Login Analysis":
+        st.subheader("🔐 Login Analysis")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            st.plotly_chart(create_login_trend_chart(df1_login), use_container_width=True)
+        
+        with col2:
+            st.plotly_chart(create_browser_chart(df1_login), use_container_width=True)
+        
+        st.subheader("📋 Recent Failed Logins")
+        failed_logins = preview_rows(df1_login, df1_login['login_status']=='failed', last=True)
+        st.dataframe(failed_logins, use_container_width=True)
+    
+    elif analysis_type == "Session Analysis":
+        st.subheader("⏱️ Session Duration Analysis")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            st.plotly_chart(create_session_distribution(df2_duration), use_container_width=True)
+        
+        with col2:
+            # Suspicious sessions
+            st.metric("Suspicious Sessions", stats['suspicious_sessions'])
+            st.metric("Very Short (<3 min)", stats['short_sessions'])
+            st.metric("Very Long (>180 min)", stats['long_sessions'])
+        
+        st.subheader("⚠️ Suspicious Sessions")
+        suspicious_mask = compute_session_summaries(df2_duration)['suspicious_mask']
+        st.dataframe(preview_rows(df2_duration, suspicious_mask), use_container_width=True)
+    
+    elif analysis_type == "Authentication Analysis":
+        st.subheader("🔓 Authentication Analysis")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            st.plotly_chart(create_auth_pie_chart(df3_unauth), use_container_width=True)
+        
+        with col2:
+            st.plotly_chart(create_failure_reason_chart(df3_unauth), use_container_width=True)
+        
+        st.subheader("🚨 High-Risk IPs (Multiple Failed Attempts)")
+        high_risk = df3_unauth[df3_unauth['attempt_count'] > 5].sort_values('attempt_count', ascending=False)
+        st.dataframe(high_risk.head(10), use_container_width=True)
+    
+    elif analysis_type == "Attack Analysis":
+        st.subheader("⚔️ Attack Pattern Analysis")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            st.plotly_chart(create_request_type_chart(request_summaries['type_counts']), use_container_width=True)
+        
+        with col2:
+            st.plotly_chart(create_top_ips_chart(request_summaries['attack_ip_counts'], 10), use_container_width=True)
+        
+        st.plotly_chart(create_attack_heatmap(request_summaries['attack_heatmap']), use_container_width=True)
+        
+        st.subheader("🎯 Recent Attack Logs")
+        attacks = preview_rows(df4_requests, request_summaries['attack_mask'], last=True)
+        st.dataframe(attacks, use_container_width=True)
+    
+    elif analysis_type == "Service Analysis":
+        st.subheader("💳 Service Subscription Analysis")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            st.plotly_chart(create_service_chart(df5_services), use_container_width=True)
+        
+        with col2:
+            st.plotly_chart(create_subscription_status_chart(stats['service_counts']), use_container_width=True)
+        
+        st.subheader("🔴 Suspended/Inactive Services")
+        suspended = preview_rows(df5_services, df5_services['status'].isin(['suspended', 'inactive']))
+        st.dataframe(suspended, use_container_width=True)
+
+@st.fragment(run_every=1)
+def wait_for_profile_job(future):
+    """Poll a pending report each second; only this empty fragment reruns until it is ready"""
+    if future.done():
+        st.rerun()
+
+@st.fragment
+def render_profiling(df1_login, df2_duration, df3_unauth, df4_requests, df5_services):
+    """Quick column summaries, with full ydata-profiling reports on demand"""
+    st.header("🔍 Pandas Profiling Reports")
+    st.info("Quick summaries open instantly; full reports add distributions, correlations and interactions")
+    
+    report_type = st.selectbox(
+        "Select Report to Generate:",
+        ["User Login Logs", "Session Duration Logs", "Unauth Access Logs", 
+         "Request Logs", "Service Subscription Logs"]
+    )
+    depth = st.radio("Depth:", ["Quick", "Full"], horizontal=True)
+    
+    # Select appropriate dataframe
+    if report_type == "User Login Logs":
+        df_selected = df1_login
+        title = "User Login Analysis Report"
+    elif report_type == "Session Duration Logs":
+        df_selected = df2_duration
+        title = "Session Duration Analysis Report"
+    elif report_type == "Unauth Access Logs":
+        df_selected = df3_unauth
+        title = "Unauthenticated Access Analysis Report"
+    elif report_type == "Request Logs":
+        df_selected = df4_requests
+        title = "Request & DOS Attack Analysis Report"
+    else:
+        df_selected = df5_services
+        title = "Service Subscription Analysis Report"
+    
+    if depth == "Quick":
+        summary = summarize_frame(df_selected)
+        st.subheader(f"📋 {title}")
+        st.dataframe(summary['describe'], use_container_width=True)
+        
+        cols = st.columns(max(len(summary['value_counts']), 1))
+        for col, (column, counts) in zip(cols, summary['value_counts'].items()):
+            with col:
+                st.markdown(f"**{column}**")
+                st.dataframe(counts.reset_index(name='Count'), use_container_width=True)
+        return
+    
+    # Reports belong to one dataset of one load; the stored paths identify the load
+    data_id = tuple(st.session_state.get('data_paths', ()))
+    
+    if st.button("📊 Generate Pandas Profile Report"):
+        if load_profile_report() is None:
+            st.error("❌ ydata-profiling is not installed. Run `pip install ydata-profiling` to enable reports.")
+        else:
+            st.session_state['profile_job'] = {
+                'report_type': report_type,
+                'data_id': data_id,
+                'future': get_profile_executor().submit(build_profile_html, df_selected, title)
+            }
+    
+    job = st.session_state.get('profile_job')
+    if job is None:
+        return
+    if job['report_type'] != report_type or job['data_id'] != data_id:
+        del st.session_state['profile_job']
+        return
+    
+    if not job['future'].done():
+        st.info(f"⏳ Generating profile report for {job['report_type']}...")
+        wait_for_profile_job(job['future'])
+        return
+    
+    try:
+        profile_html = job['future'].result()
+    except Exception as e:
+        st.error(f"❌ Profile report failed: {e}")
+        return
+    
+    # Display in iframe
+    st.success(f"✅ {job['report_type']} report generated successfully!")
+    components.html(profile_html, height=800, scrolling=True)
+    
+    # Download button
+    st.download_button(
+        label="📥 Download HTML Report",
+        data=profile_html,
+        file_name=f"{job['report_type'].lower().replace(' ', '_')}_profile.html",
+        mime="text/html"
+    )
+
+def build_summary_report(stats, fraud_score, risk_level):
+    """Plain-text summary report, written line by line from the shared stats"""
+    buf = StringIO()
+    w = buf.write
+    
+    w("UPI LOG ANALYZER - SUMMARY REPORT\n")
+    w(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+    w(f"{'='*60}\n\n")
+    
+    w("1. LOGIN ANALYSIS:\n")
+    w(f"   - Total Logins: {stats['total_logins']}\n")
+    w(f"   - Successful: {stats['login_counts'].get('success', 0)}\n")
+    w(f"   - Failed: {stats['failed_count']}\n")
+    w(f"   - Unique Users: {stats['unique_users']}\n\n")
+    
+    w("2. SESSION ANALYSIS:\n")
+    w(f"   - Total Sessions: {stats['total_sessions']}\n")
+    w(f"   - Average Duration: {stats['avg_duration']:.2f} minutes\n")
+    w(f"   - Suspicious Short (<3 min): {stats['short_sessions']}\n")
+    w(f"   - Suspicious Long (>180 min): {stats['long_sessions']}\n\n")
+    
+    w("3. AUTHENTICATION ANALYSIS:\n")
+    w(f"   - Total Attempts: {stats['total_auth_attempts']}\n")
+    w(f"   - Authenticated: {stats['auth_counts'].get('authenticated', 0)}\n")
+    w(f"   - Unauthenticated: {stats['unauth_count']}\n\n")
+    
+    w("4. ATTACK ANALYSIS:\n")
+    w(f"   - Total Requests: {stats['total_requests']}\n")
+    w(f"   - Normal: {stats['request_counts'].get('normal', 0)}\n")
+    w(f"   - Blank Requests: {stats['blank_count']}\n")
+    w(f"   - DOS Attacks: {stats['dos_count']}\n\n")
+    
+    w("5. SERVICE ANALYSIS:\n")
+    w(f"   - Total Subscriptions: {stats['total_subscriptions']}\n")
+    w(f"   - Active: {stats['service_counts'].get('active', 0)}\n")
+    w(f"   - Suspended: {stats['service_counts'].get('suspended', 0)}\n\n")
+    
+    w(f"FRAUD RISK SCORE: {fraud_score:.2f}/100\n")
+    w(f"RISK LEVEL: {risk_level}\n")
+    w(f"{'='*60}\n")
+    return buf.getvalue()
+
+@st.fragment
+def render_export(df1_login, df2_duration, df3_unauth, df4_requests, df5_services, stats):
+    """CSV downloads and the text summary report"""
+    st.header("📥 Data Export Options")
+    
+    st.subheader("Download Generated CSV Files")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.download_button(
+            "📄 Download Login Logs CSV",
+            to_csv_bytes(df1_login, 'login'),
+            "user_login_logs.csv",
+            "text/csv"
+        )
+        
+        st.download_button(
+            "📄 Download Session Logs CSV",
+            to_csv_bytes(df2_duration, 'session'),
+            "session_duration_logs.csv",
+            "text/csv"
+        )
+        
+        st.download_button(
+            "📄 Download Unauth Logs CSV",
+            to_csv_bytes(df3_unauth, 'unauth'),
+            "unauth_access_logs.csv",
+            "text/csv"
+        )
+    
+    with col2:
+        st.download_button(
+            "📄 Download Request Logs CSV",
+            to_csv_bytes(df4_requests, 'request'),
+            "request_logs.csv",
+            "text/csv"
+        )
+        
+        st.download_button(
+            "📄 Download Service Logs CSV",
+            to_csv_bytes(df5_services, 'service'),
+            "service_subscription_logs.csv",
+            "text/csv"
+        )
+    
+    st.markdown("---")
+    
+    st.subheader("📊 Export Summary Report")
+    
+    if st.button("Generate Summary Report"):
+        _, fraud_score, risk_level = create_fraud_score_gauge(stats)
+        
+        summary = build_summary_report(stats, fraud_score, risk_level)
+        
+        st.text_area("Summary Report", summary, height=400)
+        
+        st.download_button(
+            "📥 Download Summary Report",
+            summary,
+            "summary_report.txt",
+            "text/plain"
+        )
+
+def render_anomalies(df1_login, df2_duration, df3_unauth, df5_services, request_summaries, stats):
+    """Rule-based anomaly alerts"""
+    st.header("⚠️ Anomaly Detection")
+    
+    st.subheader("🚨 Detected Anomalies")
+    
+    # Failed Login Anomalies
+    with st.expander("🔴 Critical: Failed Login Patterns"):
+        failed_by_ip = count_failed_logins_by_ip(df1_login)
+        critical_ips = failed_by_ip[failed_by_ip > 5]
+        
+        if len(critical_ips) > 0:
+            st.warning(f"Found {len(critical_ips)} IPs with >5 failed login attempts")
+            st.dataframe(critical_ips.reset_index(name='Failed Attempts'))
+        else:
+            st.success("No critical failed login patterns detected")
+    
+    # Session Duration Anomalies
+    with st.expander("🟡 Warning: Suspicious Session Durations"):
+        if stats['suspicious_sessions'] > 0:
+            st.warning(f"Found {stats['suspicious_sessions']} suspicious sessions")
+            suspicious_mask = compute_session_summaries(df2_duration)['suspicious_mask']
+            st.dataframe(preview_rows(df2_duration, suspicious_mask))
+        else:
+            st.success("No suspicious session durations detected")
+    
+    # Brute Force Detection
+    with st.expander("🔴 Critical: Brute Force Attempts"):
+        brute_force = df3_unauth[
+            (df3_unauth['auth_status']=='unauthenticated') & 
+            (df3_unauth['attempt_count'] > 10)
+        ]
+        
+        if len(brute_force) > 0:
+            st.error(f"⚠️ Detected {len(brute_force)} potential brute force attacks!")
+            st.dataframe(brute_force)
+        else:
+            st.success("No brute force patterns detected")
+    
+    # DOS Attack Alerts
+    with st.expander("🔴 Critical: DOS Attack Patterns"):
+        if stats['dos_count'] > 0:
+            st.error(f"⚠️ Detected {stats['dos_count']} DOS attacks!")
+            
+            dos_by_ip = request_summaries['dos_ip_counts']
+            st.dataframe(dos_by_ip.head(10).reset_index(name='Attack Count'))
+        else:
+            st.success("No DOS attacks detected")
+    
+    # Suspended Services
+    with st.expander("🟡 Warning: Suspended Services"):
+        suspended_count = stats['service_counts'].get('suspended', 0)
+        
+        if suspended_count > 0:
+            st.warning(f"Found {suspended_count} suspended services")
+            st.dataframe(preview_rows(df5_services, df5_services['status']=='suspended'))
+        else:
+            st.success("No suspended services found")
+
 # ============================================================================
 # MAIN APP
 # ============================================================================
@@ -461,11 +1205,16 @@ def main():
             # Load or generate data
             if data_source == "📤 Upload CSV Files":
                 if all([uploaded_login, uploaded_duration, uploaded_unauth, uploaded_request, uploaded_service]):
-                    df1_login = pd.read_csv(uploaded_login)
-                    df2_duration = pd.read_csv(uploaded_duration)
-                    df3_unauth = pd.read_csv(uploaded_unauth)
-                    df4_requests = pd.read_csv(uploaded_request)
-                    df5_services = pd.read_csv(uploaded_service)
+                    try:
+                        df1_login = load_csv(uploaded_login.getvalue(), 'login', uploaded_login.name)
+                        df2_duration = load_csv(uploaded_duration.getvalue(), 'session', uploaded_duration.name)
+                        df3_unauth = load_csv(uploaded_unauth.getvalue(), 'unauth', uploaded_unauth.name)
+                        df4_requests = load_csv(uploaded_request.getvalue(), 'request', uploaded_request.name)
+                        df5_services = load_csv(uploaded_service.getvalue(), 'service', uploaded_service.name)
+                    except ValueError as e:
+                        st.error(f"❌ Could not parse the uploaded files: {e}")
+                        return
+                    add_time_columns(df1_login, df4_requests)
                     st.success("✅ All files uploaded successfully!")
                 else:
                     st.error("❌ Please upload all 5 CSV files to proceed!")
@@ -474,424 +1223,67 @@ def main():
                 df1_login, df2_duration, df3_unauth, df4_requests, df5_services = generate_synthetic_data()
                 st.success("✅ Synthetic data generated successfully!")
             
-            # Store in session state
-            st.session_state['df1_login'] = df1_login
-            st.session_state['df2_duration'] = df2_duration
-            st.session_state['df3_unauth'] = df3_unauth
-            st.session_state['df4_requests'] = df4_requests
-            st.session_state['df5_services'] = df5_services
+            # Store on disk, keeping only the paths in session state. Synthetic data
+            # is already on disk in its Parquet cache unless that write failed.
+            if data_source != "📤 Upload CSV Files" and all(f.exists() for f in SYNTHETIC_CACHE_FILES):
+                paths = [str(f) for f in SYNTHETIC_CACHE_FILES]
+            else:
+                try:
+                    paths = save_datasets([df1_login, df2_duration, df3_unauth, df4_requests, df5_services])
+                except OSError as e:
+                    st.error(f"❌ Could not store the loaded data: {e}")
+                    return
+            
+            old_paths = st.session_state.get('data_paths')
+            if old_paths and old_paths != paths:
+                discard_session_data(old_paths)
+            
+            st.session_state['data_paths'] = paths
+            st.session_state.pop('profile_job', None)
             st.session_state['data_loaded'] = True
     
     # Display dashboard if data is loaded
     if st.session_state.get('data_loaded', False):
         
-        df1_login = st.session_state['df1_login']
-        df2_duration = st.session_state['df2_duration']
-        df3_unauth = st.session_state['df3_unauth']
-        df4_requests = st.session_state['df4_requests']
-        df5_services = st.session_state['df5_services']
-        
-        # Tabs for different sections
-        tab1, tab2, tab3, tab4, tab5 = st.tabs([
-            "📊 Dashboard Overview", 
-            "📈 Detailed Analysis", 
-            "🔍 Pandas Profiling",
-            "📥 Data Export",
-            "⚠️ Anomaly Detection"
-        ])
-        
-        # ===== TAB 1: Dashboard Overview =====
-        with tab1:
-            st.header("📊 Executive Dashboard")
-            
-            # Fraud Risk Score
-            col1, col2, col3 = st.columns([2, 1, 1])
-            
-            with col1:
-                fraud_fig, fraud_score, risk_level = create_fraud_score_gauge(df1_login, df3_unauth, df4_requests)
-                st.plotly_chart(fraud_fig, use_container_width=True)
-            
-            with col2:
-                st.metric("Total Login Attempts", len(df1_login))
-                st.metric("Failed Logins", len(df1_login[df1_login['login_status']=='failed']))
-                st.metric("Unique Users", df1_login['user_id'].nunique())
-            
-            with col3:
-                st.metric("DOS Attacks", len(df4_requests[df4_requests['request_type']=='dos_attack']))
-                st.metric("Blank Requests", len(df4_requests[df4_requests['request_type']=='blank']))
-                st.metric("Unauth Attempts", len(df3_unauth[df3_unauth['auth_status']=='unauthenticated']))
-            
-            st.markdown("---")
-            
-            # Key Metrics Cards
-            st.subheader("🎯 Key Security Metrics")
-            
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                failed_rate = len(df1_login[df1_login['login_status']=='failed']) / len(df1_login) * 100
-                st.markdown(f"""
-                <div class="{'alert-critical' if failed_rate > 10 else 'alert-success'}">
-                    <h4>Login Failure Rate</h4>
-                    <h2>{failed_rate:.1f}%</h2>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col2:
-                avg_duration = df2_duration['duration_minutes'].mean()
-                st.markdown(f"""
-                <div class="alert-success">
-                    <h4>Avg Session Duration</h4>
-                    <h2>{avg_duration:.1f} min</h2>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col3:
-                unauth_rate = len(df3_unauth[df3_unauth['auth_status']=='unauthenticated']) / len(df3_unauth) * 100
-                st.markdown(f"""
-                <div class="{'alert-critical' if unauth_rate > 30 else 'alert-warning'}">
-                    <h4>Unauth Rate</h4>
-                    <h2>{unauth_rate:.1f}%</h2>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col4:
-                attack_count = len(df4_requests[df4_requests['request_type'].isin(['blank', 'dos_attack'])])
-                st.markdown(f"""
-                <div class="{'alert-critical' if attack_count > 100 else 'alert-warning'}">
-                    <h4>Total Attacks</h4>
-                    <h2>{attack_count}</h2>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            st.markdown("---")
-            
-            # Quick Visualizations
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.plotly_chart(create_login_trend_chart(df1_login), use_container_width=True)
-                st.plotly_chart(create_auth_pie_chart(df3_unauth), use_container_width=True)
-            
-            with col2:
-                st.plotly_chart(create_request_type_chart(df4_requests), use_container_width=True)
-                st.plotly_chart(create_session_distribution(df2_duration), use_container_width=True)
-        
-        # ===== TAB 2: Detailed Analysis =====
-        with tab2:
-            st.header("📈 Detailed Analysis & Visualizations")
-            
-            analysis_type = st.selectbox(
-                "Select Analysis Type:",
-                ["Login Analysis", "Session Analysis", "Authentication Analysis", 
-                 "Attack Analysis", "Service Analysis"]
-            )
-            
-            if analysis_type == "Login Analysis":
-                st.subheader("🔐 Login Analysis")
-                
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.plotly_chart(create_login_trend_chart(df1_login), use_container_width=True)
-                
-                with col2:
-                    # Browser distribution
-                    browser_counts = df1_login['browser'].value_counts()
-                    fig = px.pie(values=browser_counts.values, names=browser_counts.index,
-                                title='Browser Distribution')
-                    st.plotly_chart(fig, use_container_width=True)
-                
-                st.subheader("📋 Recent Failed Logins")
-                failed_logins = df1_login[df1_login['login_status']=='failed'].tail(10)
-                st.dataframe(failed_logins, use_container_width=True)
-            
-            elif analysis_type == "Session Analysis":
-                st.subheader("⏱️ Session Duration Analysis")
-                
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.plotly_chart(create_session_distribution(df2_duration), use_container_width=True)
-                
-                with col2:
-                    # Suspicious sessions
-                    suspicious = df2_duration[
-                        (df2_duration['duration_minutes'] < 3) | 
-                        (df2_duration['duration_minutes'] > 180)
-                    ]
-                    
-                    st.metric("Suspicious Sessions", len(suspicious))
-                    st.metric("Very Short (<3 min)", len(df2_duration[df2_duration['duration_minutes'] < 3]))
-                    st.metric("Very Long (>180 min)", len(df2_duration[df2_duration['duration_minutes'] > 180]))
-                
-                st.subheader("⚠️ Suspicious Sessions")
-                st.dataframe(suspicious.head(10), use_container_width=True)
-            
-            elif analysis_type == "Authentication Analysis":
-                st.subheader("🔓 Authentication Analysis")
-                
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.plotly_chart(create_auth_pie_chart(df3_unauth), use_container_width=True)
-                
-                with col2:
-                    # Failure reasons
-                    failure_df = df3_unauth[df3_unauth['auth_status']=='unauthenticated']
-                    reason_counts = failure_df['failure_reason'].value_counts()
-                    
-                    fig = px.bar(x=reason_counts.index, y=reason_counts.values,
-                                title='Authentication Failure Reasons',
-                                labels={'x': 'Reason', 'y': 'Count'})
-                    fig.update_layout(xaxis_tickangle=-45)
-                    st.plotly_chart(fig, use_container_width=True)
-                
-                st.subheader("🚨 High-Risk IPs (Multiple Failed Attempts)")
-                high_risk = df3_unauth[df3_unauth['attempt_count'] > 5].sort_values('attempt_count', ascending=False)
-                st.dataframe(high_risk.head(10), use_container_width=True)
-            
-            elif analysis_type == "Attack Analysis":
-                st.subheader("⚔️ Attack Pattern Analysis")
-                
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.plotly_chart(create_request_type_chart(df4_requests), use_container_width=True)
-                
-                with col2:
-                    st.plotly_chart(create_top_ips_chart(df4_requests, 10), use_container_width=True)
-                
-                st.plotly_chart(create_attack_heatmap(df4_requests), use_container_width=True)
-                
-                st.subheader("🎯 Recent Attack Logs")
-                attacks = df4_requests[df4_requests['request_type'].isin(['blank', 'dos_attack'])].tail(10)
-                st.dataframe(attacks, use_container_width=True)
-            
-            elif analysis_type == "Service Analysis":
-                st.subheader("💳 Service Subscription Analysis")
-                
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.plotly_chart(create_service_chart(df5_services), use_container_width=True)
-                
-                with col2:
-                    # Status distribution
-                    status_counts = df5_services['status'].value_counts()
-                    fig = px.pie(values=status_counts.values, names=status_counts.index,
-                                title='Subscription Status Distribution')
-                    st.plotly_chart(fig, use_container_width=True)
-                
-                st.subheader("🔴 Suspended/Inactive Services")
-                suspended = df5_services[df5_services['status'].isin(['suspended', 'inactive'])]
-                st.dataframe(suspended.head(10), use_container_width=True)
-        
-        # ===== TAB 3: Pandas Profiling =====
-        with tab3:
-            st.header("🔍 Pandas Profiling Reports")
-            st.info("Generate comprehensive HTML reports for each dataset")
-            
-            report_type = st.selectbox(
-                "Select Report to Generate:",
-                ["User Login Logs", "Session Duration Logs", "Unauth Access Logs", 
-                 "Request Logs", "Service Subscription Logs"]
+        try:
+            touch_session_data(st.session_state['data_paths'])
+            df1_login, df2_duration, df3_unauth, df4_requests, df5_services = (
+                load_dataset(path) for path in st.session_state['data_paths']
             )
-            
-            if st.button("📊 Generate Pandas Profile Report"):
-                with st.spinner(f"Generating profile report for {report_type}..."):
-                    
-                    # Select appropriate dataframe
-                    if report_type == "User Login Logs":
-                        df_selected = df1_login
-                        title = "User Login Analysis Report"
-                    elif report_type == "Session Duration Logs":
-                        df_selected = df2_duration
-                        title = "Session Duration Analysis Report"
-                    elif report_type == "Unauth Access Logs":
-                        df_selected = df3_unauth
-                        title = "Unauthenticated Access Analysis Report"
-                    elif report_type == "Request Logs":
-                        df_selected = df4_requests
-                        title = "Request & DOS Attack Analysis Report"
-                    else:
-                        df_selected = df5_services
-                        title = "Service Subscription Analysis Report"
-                    
-                    # Generate profile
-                    profile = ProfileReport(df_selected, title=title, explorative=True)
-                    
-                    # Export to HTML
-                    profile_html = profile.to_html()
-                    
-                    # Display in iframe
-                    st.success("✅ Report generated successfully!")
-                    components.html(profile_html, height=800, scrolling=True)
-                    
-                    # Download button
-                    st.download_button(
-                        label="📥 Download HTML Report",
-                        data=profile_html,
-                        file_name=f"{report_type.lower().replace(' ', '_')}_profile.html",
-                        mime="text/html"
-                    )
-        
-        # ===== TAB 4: Data Export =====
-        with tab4:
-            st.header("📥 Data Export Options")
-            
-            st.subheader("Download Generated CSV Files")
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.download_button(
-                    "📄 Download Login Logs CSV",
-                    df1_login.to_csv(index=False),
-                    "user_login_logs.csv",
-                    "text/csv"
-                )
-                
-                st.download_button(
-                    "📄 Download Session Logs CSV",
-                    df2_duration.to_csv(index=False),
-                    "session_duration_logs.csv",
-                    "text/csv"
-                )
-                
-                st.download_button(
-                    "📄 Download Unauth Logs CSV",
-                    df3_unauth.to_csv(index=False),
-                    "unauth_access_logs.csv",
-                    "text/csv"
-                )
-            
-            with col2:
-                st.download_button(
-                    "📄 Download Request Logs CSV",
-                    df4_requests.to_csv(index=False),
-                    "request_logs.csv",
-                    "text/csv"
-                )
-                
-                st.download_button(
-                    "📄 Download Service Logs CSV",
-                    df5_services.to_csv(index=False),
-                    "service_subscription_logs.csv",
-                    "text/csv"
-                )
-            
-            st.markdown("---")
-            
-            st.subheader("📊 Export Summary Report")
-            
-            if st.button("Generate Summary Report"):
-                summary = f"""
-UPI LOG ANALYZER - SUMMARY REPORT
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-{'='*60}
-
-1. LOGIN ANALYSIS:
-   - Total Logins: {len(df1_login)}
-   - Successful: {len(df1_login[df1_login['login_status']=='success'])}
-   - Failed: {len(df1_login[df1_login['login_status']=='failed'])}
-   - Unique Users: {df1_login['user_id'].nunique()}
-
-2. SESSION ANALYSIS:
-   - Total Sessions: {len(df2_duration)}
-   - Average Duration: {df2_duration['duration_minutes'].mean():.2f} minutes
-   - Suspicious Short (<3 min): {len(df2_duration[df2_duration['duration_minutes']<3])}
-   - Suspicious Long (>180 min): {len(df2_duration[df2_duration['duration_minutes']>180])}
-
-3. AUTHENTICATION ANALYSIS:
-   - Total Attempts: {len(df3_unauth)}
-   - Authenticated: {len(df3_unauth[df3_unauth['auth_status']=='authenticated'])}
-   - Unauthenticated: {len(df3_unauth[df3_unauth['auth_status']=='unauthenticated'])}
-
-4. ATTACK ANALYSIS:
-   - Total Requests: {len(df4_requests)}
-   - Normal: {len(df4_requests[df4_requests['request_type']=='normal'])}
-   - Blank Requests: {len(df4_requests[df4_requests['request_type']=='blank'])}
-   - DOS Attacks: {len(df4_requests[df4_requests['request_type']=='dos_attack'])}
-
-5. SERVICE ANALYSIS:
-   - Total Subscriptions: {len(df5_services)}
-   - Active: {len(df5_services[df5_services['status']=='active'])}
-   - Suspended: {len(df5_services[df5_services['status']=='suspended'])}
-
-FRAUD RISK SCORE: {fraud_score:.2f}/100
-RISK LEVEL: {risk_level}
-{'='*60}
-                """
-                
-                st.text_area("Summary Report", summary, height=400)
-                
-                st.download_button(
-                    "📥 Download Summary Report",
-                    summary,
-                    "summary_report.txt",
-                    "text/plain"
-                )
-        
-        # ===== TAB 5: Anomaly Detection =====
-        with tab5:
-            st.header("⚠️ Anomaly Detection")
-            
-            st.subheader("🚨 Detected Anomalies")
-            
-            # Failed Login Anomalies
-            with st.expander("🔴 Critical: Failed Login Patterns"):
-                failed_by_ip = df1_login[df1_login['login_status']=='failed'].groupby('ip_address').size()
-                critical_ips = failed_by_ip[failed_by_ip > 5].sort_values(ascending=False)
-                
-                if len(critical_ips) > 0:
-                    st.warning(f"Found {len(critical_ips)} IPs with >5 failed login attempts")
-                    st.dataframe(critical_ips.reset_index().rename(columns={0: 'Failed Attempts'}))
-                else:
-                    st.success("No critical failed login patterns detected")
-            
-            # Session Duration Anomalies
-            with st.expander("🟡 Warning: Suspicious Session Durations"):
-                suspicious_sessions = df2_duration[
-                    (df2_duration['duration_minutes'] < 3) | 
-                    (df2_duration['duration_minutes'] > 180)
-                ]
-                
-                if len(suspicious_sessions) > 0:
-                    st.warning(f"Found {len(suspicious_sessions)} suspicious sessions")
-                    st.dataframe(suspicious_sessions.head(10))
-                else:
-                    st.success("No suspicious session durations detected")
-            
-            # Brute Force Detection
-            with st.expander("🔴 Critical: Brute Force Attempts"):
-                brute_force = df3_unauth[
-                    (df3_unauth['auth_status']=='unauthenticated') & 
-                    (df3_unauth['attempt_count'] > 10)
-                ]
-                
-                if len(brute_force) > 0:
-                    st.error(f"⚠️ Detected {len(brute_force)} potential brute force attacks!")
-                    st.dataframe(brute_force)
-                else:
-                    st.success("No brute force patterns detected")
-            
-            # DOS Attack Alerts
-            with st.expander("🔴 Critical: DOS Attack Patterns"):
-                dos_attacks = df4_requests[df4_requests['request_type']=='dos_attack']
-                
-                if len(dos_attacks) > 0:
-                    st.error(f"⚠️ Detected {len(dos_attacks)} DOS attacks!")
-                    
-                    dos_by_ip = dos_attacks.groupby('ip_address').size().sort_values(ascending=False).head(10)
-                    st.dataframe(dos_by_ip.reset_index().rename(columns={0: 'Attack Count'}))
-                else:
-                    st.success("No DOS attacks detected")
-            
-            # Suspended Services
-            with st.expander("🟡 Warning: Suspended Services"):
-                suspended_services = df5_services[df5_services['status']=='suspended']
-                
-                if len(suspended_services) > 0:
-                    st.warning(f"Found {len(suspended_services)} suspended services")
-                    st.dataframe(suspended_services.head(10))
-                else:
-                    st.success("No suspended services found")
+        except OSError:
+            # Stored files expired or were cleaned up; ask for a fresh load
+            st.session_state['data_loaded'] = False
+            st.warning("⚠️ The loaded data is no longer available. Please run the analysis again.")
+            return
+        
+        request_summaries = compute_request_summaries(df4_requests)
+        stats = compute_dashboard_stats(df1_login, df2_duration, df3_unauth, df4_requests, df5_services)
+        
+        # Only the selected view is built; st.tabs would execute every tab body on each rerun.
+        # Views with their own widgets are fragments, so using them reruns just that view.
+        view = st.radio(
+            "View",
+            ["📊 Dashboard Overview", 
+             "📈 Detailed Analysis", 
+             "🔍 Pandas Profiling",
+             "📥 Data Export",
+             "⚠️ Anomaly Detection"],
+            horizontal=True,
+            label_visibility="collapsed",
+            key="view"
+        )
+        
+        if view == "📊 Dashboard Overview":
+            render_overview(df1_login, df2_duration, df3_unauth, request_summaries, stats)
+        elif view == "📈 Detailed Analysis":
+            render_detailed_analysis(df1_login, df2_duration, df3_unauth, df4_requests, df5_services,
+                                     request_summaries, stats)
+        elif view == "🔍 Pandas Profiling":
+            render_profiling(df1_login, df2_duration, df3_unauth, df4_requests, df5_services)
+        elif view == "📥 Data Export":
+            render_export(df1_login, df2_duration, df3_unauth, df4_requests, df5_services, stats)
+        else:
+            render_anomalies(df1_login, df2_duration, df3_unauth, df5_services, request_summaries, stats)
     
     else:
         # Welcome Screen